@@ -8,16 +8,35 @@ Usage: python dock2tauri.py --image nginx:alpine --host-port 8088 --container-po
 """
 
 import argparse
+import concurrent.futures
+import functools
+import http.client
 import json
+import logging
 import os
+import signal
+import socket
 import subprocess
 import sys
 import time
-import urllib.request
+import urllib.parse
 import tempfile
 import shutil
 from pathlib import Path
 
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_BASE_DIR = _SCRIPT_DIR.parent
+
+# Characters not allowed in the Tauri productName
+_PRODUCT_NAME_TRANS = str.maketrans('', '', '/\\:*?"<>|')
+# Characters in image references that are replaced in container names
+_NAME_TRANS = str.maketrans({':': '-', '/': '-'})
+
+@functools.lru_cache(maxsize=None)
+def _command_exists(command):
+    """Check if a command exists in the system PATH."""
+    return shutil.which(command) is not None
+
 class Colors:
     RED = '\033[0;31m'
     GREEN = '\033[0;32m'
@@ -47,10 +66,10 @@ class Dock2Tauri:
         self.image = image
         self.host_port = str(host_port)
         self.container_port = str(container_port)
-        self.container_name = f"dock2tauri-{image.replace(':', '-').replace('/', '-')}-{host_port}"
+        self.container_name = f"dock2tauri-{image.translate(_NAME_TRANS)}-{host_port}"
         self.container_id = None
-        self.script_dir = Path(__file__).parent
-        self.base_dir = self.script_dir.parent
+        self.script_dir = _SCRIPT_DIR
+        self.base_dir = _BASE_DIR
         self.config_file = self.base_dir / "src-tauri" / "tauri.conf.json"
         self.build_release = build_release
         self.build_target = build_target
@@ -62,56 +81,67 @@ class Dock2Tauri:
         """Check if required dependencies are available."""
         Logger.info("Checking dependencies...")
         
-        if not self._command_exists("docker"):
+        # Run the probes concurrently so the phase costs the slowest one, not the sum
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+            has_docker = pool.submit(_command_exists, "docker")
+            has_cargo = pool.submit(_command_exists, "cargo")
+            # Querying the server version reaches the daemon without the
+            # plugin/storage/swarm enumeration that `docker info` does
+            daemon_check = pool.submit(
+                subprocess.run, ["docker", "version", "--format", "{{.Server.Version}}"],
+                check=True, timeout=3,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        
+        if not has_docker.result():
             Logger.error("Docker not found. Please install Docker first.")
             return False
         
-        if not self._command_exists("cargo"):
+        if not has_cargo.result():
             Logger.warning("Rust/Cargo not found. Some features may not work.")
         
         try:
-            subprocess.run(["docker", "info"], check=True, capture_output=True)
+            daemon_check.result()
         except subprocess.CalledProcessError:
             Logger.error("Docker daemon not running. Please start Docker.")
             return False
+        except subprocess.TimeoutExpired:
+            Logger.error("Docker daemon unresponsive (>3s)")
+            return False
         
         Logger.success("Dependencies check passed")
         return True
 
-    def _command_exists(self, command):
-        """Check if a command exists in the system PATH."""
-        return subprocess.run(
-            ["which", command], 
-            capture_output=True, 
-            text=True
-        ).returncode == 0
-
     def stop_existing_containers(self):
-        """Stop containers using the same port."""
+        """Stop and remove containers using the same port or name."""
         Logger.info(f"Stopping existing containers on port {self.host_port}...")
         
         try:
             # Get containers using the same port
             result = subprocess.run([
-                "docker", "ps", "-q", "--filter", f"publish={self.host_port}"
+                "docker", "ps", "--filter", f"publish={self.host_port}",
+                "--format", "{{.ID}} {{.Names}}"
             ], capture_output=True, text=True)
+            owned_ids, foreign_ids = [], []
+            for line in result.stdout.splitlines():
+                container_id, _, name = line.partition(" ")
+                (owned_ids if name.startswith("dock2tauri-") else foreign_ids).append(container_id)
             
-            if result.stdout.strip():
-                container_ids = result.stdout.strip().split('\n')
-                for container_id in container_ids:
-                    subprocess.run(["docker", "stop", container_id], 
-                                 capture_output=True)
+            # Containers we didn't launch are only stopped, never removed
+            if foreign_ids:
+                subprocess.run(["docker", "stop", *foreign_ids],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 Logger.success("Stopped existing containers")
             
-            # Remove old container with same name
-            result = subprocess.run([
-                "docker", "ps", "-a", "--filter", f"name={self.container_name}"
-            ], capture_output=True, text=True)
-            
-            if self.container_name in result.stdout:
-                subprocess.run(["docker", "rm", self.container_name], 
-                             capture_output=True)
-                Logger.success(f"Removed old container: {self.container_name}")
+            # Stop and remove our own containers, including any old one with the same
+            # name, in a single daemon call; unknown refs make rm exit non-zero, which is fine
+            result = subprocess.run(
+                ["docker", "rm", "-f", *owned_ids, self.container_name],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            )
+            removed = result.stdout.split()
+            if removed:
+                Logger.success(f"Removed existing containers: {', '.join(removed)}")
                 
         except Exception as e:
             Logger.warning(f"Error during cleanup: {e}")
@@ -129,7 +159,7 @@ class Dock2Tauri:
                     "docker", "build", "-f", str(dockerfile), "-t", tag, str(ctx)
                 ], check=True)
                 self.image = tag
-                self.container_name = f"dock2tauri-{self.image.replace(':', '-').replace('/', '-')}-{self.host_port}"
+                self.container_name = f"dock2tauri-{self.image.translate(_NAME_TRANS)}-{self.host_port}"
         except subprocess.CalledProcessError as e:
             Logger.error(f"Failed to build Dockerfile: {e}")
             raise
@@ -141,14 +171,24 @@ class Dock2Tauri:
         Logger.info(f"Host Port: {self.host_port}")
         Logger.info(f"Container Port: {self.container_port}")
         
+        # Never contact the registry on the common path where the image is local
+        run_cmd = [
+            "docker", "run", "-d",
+            "--pull=never",
+            "-p", f"{self.host_port}:{self.container_port}",
+            "--name", self.container_name,
+            "--rm",
+            self.image
+        ]
         try:
-            result = subprocess.run([
-                "docker", "run", "-d",
-                "-p", f"{self.host_port}:{self.container_port}",
-                "--name", self.container_name,
-                "--restart", "unless-stopped",
-                self.image
-            ], capture_output=True, text=True, check=True)
+            try:
+                result = subprocess.run(run_cmd, capture_output=True, text=True, check=True)
+            except subprocess.CalledProcessError as e:
+                if "No such image" not in (e.stderr or ""):
+                    raise
+                Logger.info(f"Image {self.image} not found locally, pulling...")
+                subprocess.run(["docker", "pull", self.image], check=True)
+                result = subprocess.run(run_cmd, capture_output=True, text=True, check=True)
             
             self.container_id = result.stdout.strip()
             Logger.success(f"Container launched: {self.container_id}")
@@ -157,35 +197,77 @@ class Dock2Tauri:
             
         except subprocess.CalledProcessError as e:
             Logger.error("Failed to launch container")
-            Logger.error(f"Error: {e.stderr}")
+            Logger.error(f"Error: {e.stderr or e}")
             return False
 
     def wait_for_service(self):
         """Wait for the service to be ready."""
         Logger.info("Waiting for service to be ready...")
-        url = self.health_url or f"http://localhost:{self.host_port}"
+        url = urllib.parse.urlsplit(self.health_url or f"http://localhost:{self.host_port}")
         timeout = int(self.timeout) if self.timeout else 30
-        for _ in range(timeout):
-            try:
-                with urllib.request.urlopen(url, timeout=1) as response:
-                    if 200 <= response.status < 400:
-                        Logger.success("Service is ready!")
-                        return True
-            except Exception:
+        https = url.scheme == "https"
+        host = url.hostname or "localhost"
+        port = url.port or (443 if https else 80)
+        conn_cls = http.client.HTTPSConnection if https else http.client.HTTPConnection
+        # One connection is reused across probes so keep-alive skips the TCP handshake
+        conn = conn_cls(host, port, timeout=0.5)
+        path = url.path or "/"
+        if url.query:
+            path += f"?{url.query}"
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        try:
+            while True:
+                # A bare TCP connect is much cheaper than HTTP; only confirm over
+                # HTTP once the port accepts connections. Skip the gate while
+                # conn still holds a keep-alive socket.
+                if conn.sock is not None or self._port_open(host, port):
+                    try:
+                        # HEAD avoids downloading the response body on every probe
+                        conn.request("HEAD", path)
+                        response = conn.getresponse()
+                        response.read()
+                        if response.status in (405, 501):
+                            # Server doesn't implement HEAD; confirm with GET instead
+                            conn.request("GET", path)
+                            response = conn.getresponse()
+                            response.read()
+                        if 200 <= response.status < 400:
+                            Logger.success("Service is ready!")
+                            return True
+                    except Exception:
+                        conn.close()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
                 print(".", end="", flush=True)
-                time.sleep(1)
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, 1.0)
+        finally:
+            conn.close()
         print()  # New line
         Logger.warning("Service might not be ready yet, but continuing...")
         return False
 
+    @staticmethod
+    def _port_open(host, port):
+        """Check whether host:port accepts TCP connections."""
+        try:
+            with socket.create_connection((host, port), timeout=0.2):
+                return True
+        except OSError:
+            return False
+
     def generate_tauri_config(self):
         """Generate ephemeral Tauri configuration to be merged via --config."""
         Logger.info("Preparing Tauri configuration (ephemeral)...")
+        product_name = self.image.split(':')[0].translate(_PRODUCT_NAME_TRANS)
+        identifier_suffix = ''.join(filter(str.isalnum, self.image))
         config = {
             "$schema": "../node_modules/@tauri-apps/cli/schema.json",
-            "productName": f"Dock2Tauri - {''.join(c for c in self.image.split(':')[0] if c not in '/\\:*?\"<>|')}",
+            "productName": f"Dock2Tauri - {product_name}",
             "version": "1.0.0",
-            "identifier": f"com.dock2tauri.{''.join(c for c in self.image if c.isalnum())}",
+            "identifier": f"com.dock2tauri.{identifier_suffix}",
             "build": {
                 "beforeBuildCommand": "",
                 "beforeDevCommand": "",
@@ -217,6 +299,7 @@ class Dock2Tauri:
             },
             "plugins": {}
         }
+        tmp_path = None
         try:
             fd, tmp_path = tempfile.mkstemp(prefix="tauri.conf.", suffix=".json")
             with os.fdopen(fd, 'w') as f:
@@ -226,6 +309,9 @@ class Dock2Tauri:
             return True
         except Exception as e:
             Logger.error(f"Failed to prepare Tauri config: {e}")
+            # Don't leave a partially written config behind
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
             return False
 
     def launch_tauri(self):
@@ -235,11 +321,9 @@ class Dock2Tauri:
         else:
             Logger.info("Launching Tauri application (dev)...")
         
-        tauri_dir = self.script_dir.parent / "src-tauri"
+        tauri_dir = self.base_dir / "src-tauri"
         
         try:
-            os.chdir(tauri_dir)
-            
             # Build command based on flags
             if self.build_release:
                 if self.build_target:
@@ -252,8 +336,8 @@ class Dock2Tauri:
                 cmd += ["--config", self.tauri_config_path]
             
             # Try Tauri CLI first
-            if self._command_exists("cargo"):
-                subprocess.run(cmd, check=True)
+            if _command_exists("cargo"):
+                self._run_forwarding_signals(cmd, cwd=tauri_dir)
             else:
                 Logger.error("Cargo not found. Please install Rust and Tauri CLI.")
                 Logger.info(f"Container is running at: http://localhost:{self.host_port}")
@@ -269,16 +353,46 @@ class Dock2Tauri:
         
         return True
 
+    def _run_forwarding_signals(self, cmd, cwd=None):
+        """Run cmd as a child process, forwarding SIGTERM so cleanup() still runs.
+        
+        A child that exits from a forwarded signal counts as a clean shutdown.
+        """
+        proc = subprocess.Popen(cmd, cwd=cwd)
+        forwarded = []
+        
+        def forward(signum, frame):
+            forwarded.append(signum)
+            proc.send_signal(signum)
+        
+        previous = signal.signal(signal.SIGTERM, forward)
+        try:
+            try:
+                returncode = proc.wait()
+            except KeyboardInterrupt:
+                # The child got the same SIGINT from the terminal; let it shut down
+                try:
+                    proc.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                raise
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+        if forwarded and returncode in (-forwarded[-1], 128 + forwarded[-1]):
+            # The child exited because we passed on a shutdown request
+            Logger.info("Application terminated by signal")
+        elif returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
+
     def cleanup(self):
         """Clean up resources."""
         Logger.info("Cleaning up...")
         
         if self.container_id:
             try:
-                subprocess.run(["docker", "stop", self.container_id], 
-                             capture_output=True)
-                subprocess.run(["docker", "rm", self.container_id], 
-                             capture_output=True)
+                # Launched with --rm, so killing it also removes it
+                subprocess.run(["docker", "kill", self.container_id], 
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 Logger.success("Container stopped and removed")
             except Exception as e:
                 Logger.warning(f"Error during container cleanup: {e}")
@@ -384,7 +498,6 @@ def main():
         args.debug = True
     
     if args.debug:
-        import logging
         logging.basicConfig(level=logging.DEBUG)
         Logger.info("Debug mode enabled")
     
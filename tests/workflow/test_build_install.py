@@ -4,7 +4,13 @@ E2E Workflow Tests for Dock2Tauri
 Tests the complete build, install, and run workflow using Python automation
 """
 
+import fcntl
+import json
 import os
+import platform
+import re
+import select
+import shlex
 import subprocess
 import tempfile
 import time
@@ -13,6 +19,11 @@ import shutil
 import signal
 from pathlib import Path
 
+_HERE = Path(__file__).resolve().parent
+_PROJECT_ROOT = _HERE.parent.parent
+# SGR colour codes, e.g. cargo's "\x1b[1m\x1b[32m     Running\x1b[0m `target/..."
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+
 
 class Dock2TauriWorkflowTests(unittest.TestCase):
     """Test the complete Dock2Tauri workflow from build to execution"""
@@ -20,8 +31,9 @@ class Dock2TauriWorkflowTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test environment"""
-        cls.project_root = Path(__file__).parent.parent.parent
+        cls.project_root = _PROJECT_ROOT
         cls.test_timeout = 300  # 5 minutes timeout for build operations
+        cls._build_done = False  # Set once make build succeeds, shared by build-dependent tests
         
     def setUp(self):
         """Set up each test"""
@@ -62,6 +74,37 @@ class Dock2TauriWorkflowTests(unittest.TestCase):
         except Exception as e:
             self.fail(f"Command failed: {cmd}, Error: {e}")
     
+    def wait_for_output(self, proc, markers, timeout):
+        """Read proc's stdout/stderr until a marker appears, proc exits or timeout passes"""
+        streams = [proc.stdout, proc.stderr]
+        for stream in streams:
+            fd = stream.fileno()
+            fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+        
+        output = ""
+        deadline = time.monotonic() + timeout
+        while streams and time.monotonic() < deadline:
+            readable, _, _ = select.select(streams, [], [], 0.25)
+            for stream in readable:
+                chunk = os.read(stream.fileno(), 4096)
+                if not chunk:
+                    streams.remove(stream)  # EOF, process is closing its output
+                    continue
+                output += chunk.decode(errors="replace")
+            # Match against uncoloured text; escapes can sit inside a marker
+            plain = _ANSI_ESCAPE.sub("", output)
+            if any(marker in plain for marker in markers):
+                break
+            if proc.poll() is not None and not readable:
+                break
+        if not streams:
+            # Both pipes closed, so let the exit status settle before callers poll()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+        return output
+    
     def test_dependency_installation(self):
         """Test that dependencies can be installed"""
         # Test dry-run first
@@ -74,8 +117,12 @@ class Dock2TauriWorkflowTests(unittest.TestCase):
         self.assertEqual(result.returncode, 0,
                         f"Install script validation failed: {result.stderr}")
     
-    def test_build_process(self):
-        """Test the complete build process"""
+    def _ensure_built(self):
+        """Run a clean build unless an earlier test in this class already did"""
+        target_dir = self.project_root / "src-tauri" / "target" / "release"
+        if type(self)._build_done and target_dir.exists():
+            return
+        
         # Clean any existing builds
         self.run_command(['make', 'clean'], timeout=60)
         
@@ -89,6 +136,12 @@ class Dock2TauriWorkflowTests(unittest.TestCase):
             else:
                 self.fail(f"Build failed: {result.stderr}")
         
+        type(self)._build_done = True
+    
+    def test_build_process(self):
+        """Test the complete build process"""
+        self._ensure_built()
+        
         # Check that build artifacts exist
         target_dir = self.project_root / "src-tauri" / "target" / "release"
         self.assertTrue(target_dir.exists(), "Build target directory not found")
@@ -97,14 +150,13 @@ class Dock2TauriWorkflowTests(unittest.TestCase):
         """Test that bundles are generated correctly"""
         # Skip if we can't build
         try:
-            self.test_build_process()
+            self._ensure_built()
         except unittest.SkipTest:
             self.skipTest("Cannot test bundle without successful build")
         
         bundle_dir = self.project_root / "src-tauri" / "target" / "release" / "bundle"
         
         # Check for different bundle types based on OS
-        import platform
         system = platform.system().lower()
         
         if system == "linux":
@@ -184,8 +236,11 @@ class Dock2TauriWorkflowTests(unittest.TestCase):
         )
         self.processes.append(dev_process)
         
-        # Wait a few seconds for startup
-        time.sleep(10)
+        # Tail output until dev mode reports it is up, instead of a fixed sleep
+        # cargo prints "Running `target/...`" right before it starts the app binary
+        early_output = self.wait_for_output(dev_process, ("Running `",), timeout=30)
+        # Give the app a moment to crash on launch before checking on it
+        early_output += self.wait_for_output(dev_process, (), timeout=3)
         
         # Check if process is still running (not crashed immediately)
         poll_result = dev_process.poll()
@@ -193,6 +248,7 @@ class Dock2TauriWorkflowTests(unittest.TestCase):
         if poll_result is not None:
             # Process terminated, check why
             stdout, stderr = dev_process.communicate()
+            stderr = early_output + stderr
             if "webkit" in stderr.lower() or "dependency" in stderr.lower():
                 self.skipTest("Missing development dependencies")
             elif "port" in stderr.lower() and "use" in stderr.lower():
@@ -224,13 +280,17 @@ class Dock2TauriWorkflowTests(unittest.TestCase):
     def test_script_permissions_and_syntax(self):
         """Test that all scripts have correct permissions and syntax"""
         scripts_dir = self.project_root / "scripts"
+        scripts = sorted(scripts_dir.glob("*.sh"))
         
-        for script_file in scripts_dir.glob("*.sh"):
-            # Test syntax
-            result = self.run_command(['bash', '-n', str(script_file)])
-            self.assertEqual(result.returncode, 0,
-                           f"Syntax error in {script_file}: {result.stderr}")
-            
+        # Test syntax of every script from a single shell instead of one bash per file
+        check = "status=0\n" + "".join(
+            f"bash -n {shlex.quote(str(script_file))} || status=1\n" for script_file in scripts
+        ) + "exit $status"
+        result = self.run_command(['bash', '-c', check])
+        self.assertEqual(result.returncode, 0,
+                       f"Syntax error in scripts: {result.stderr}")
+        
+        for script_file in scripts:
             # Test that script is executable
             self.assertTrue(os.access(script_file, os.X_OK),
                           f"Script {script_file} is not executable")
@@ -242,7 +302,6 @@ class Dock2TauriWorkflowTests(unittest.TestCase):
         self.assertTrue(tauri_config.exists(), "tauri.conf.json not found")
         
         # Validate JSON syntax
-        import json
         try:
             with open(tauri_config, 'r') as f:
                 config = json.load(f)
@@ -269,12 +328,10 @@ class PerformanceTests(unittest.TestCase):
     
     def test_build_time_reasonable(self):
         """Test that build completes within reasonable time"""
-        project_root = Path(__file__).parent.parent.parent
-        
         start_time = time.time()
         result = subprocess.run(
             ['make', 'build'],
-            cwd=project_root,
+            cwd=_PROJECT_ROOT,
             timeout=900,  # 15 minute max
             capture_output=True,
             text=True